@@ -18,7 +18,7 @@ class FormDataEncoder:
         self.data = data # The data to encode, as a dict
 
     def marshalValue(self, name, value):
-        if isinstance(value, basestring):
+        if isinstance(value, str):
             return '%s=%s' % (name, quote(str(value)))
         elif isinstance(value, float):
             return '%s:float=%s' % (name, value)
@@ -57,7 +57,7 @@ class SoapDataEncoder:
 
     def encode(self):
         # Do nothing if we have a SOAP message already
-        if isinstance(self.data, basestring): return self.data
+        if isinstance(self.data, str): return self.data
         # self.data is here a Python object. Wrap it in a SOAP Body.
         soap = Object(Body=self.data)
         # Marshall it.
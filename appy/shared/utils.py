@@ -321,8 +321,8 @@ def getStringDict(d):
     res = []
     for k, v in d.items():
         if type(v) not in sequenceTypes:
-            if not isinstance(k, basestring): k = str(k)
-            if not isinstance(v, basestring): v = str(v)
+            if not isinstance(k, str): k = str(k)
+            if not isinstance(v, str): v = str(v)
             value = "'%s':'%s'" % (k, v.replace("'", "\\'"))
         else:
             value = "'%s':%s" % (k, v)
@@ -816,12 +816,12 @@ class XmlMarshaller:
                                           field.getValue(instance))
                     self.dumpField(res, field.name, v)
                 # Dump the object history
-                if hasattr(instance.aq_base, 'workflow_history'):
+                wfHistory = getattr(instance.aq_base, 'workflow_history', None)
+                if wfHistory is not None:
                     histTag = self.getTagName('history')
                     eventTag = self.getTagName('event')
                     res.write('<%s type="list">' % histTag)
-                    key = list(instance.workflow_history.keys())[0]
-                    history = instance.workflow_history[key]
+                    history = wfHistory[next(iter(wfHistory))]
                     for event in history:
                         res.write('<%s type="object">' % eventTag)
                         for k, v in event.items():